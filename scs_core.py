@@ -1,30 +1,45 @@
-import io
+import math
 import os
 import re
+import shelve
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from io import BytesIO
-from typing import Tuple, List, Dict, Optional, Literal
+from functools import lru_cache
+from typing import Tuple, List, Dict, Optional, Literal, Callable, Deque, TYPE_CHECKING
 
-import discogs_client
-from dotenv import load_dotenv
-from fpdf import FPDF
+# discogs_client, dotenv and fpdf are imported where they are used, so importing this module stays cheap
+if TYPE_CHECKING:
+    import discogs_client
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscTrack:
     position: str          # Original position string (e.g., "1-1", "A1", "1")
     title: str
+    display_title: str    # Title as shown on the label (e.g. with brackets stripped)
     disc_number: int      # Extracted disc number
     track_number: int     # Extracted track number
     overall_number: int   # Sequential track number across all discs
 
-@dataclass
+@dataclass(slots=True)
 class DiscData:
     album: str
     artist: str
     disc: int
     tracks: List[DiscTrack]
 
+# Pre-compiled regular expressions
+_DISCOGS_URL_RE = re.compile(r"discogs\.com/(release|master)/(\d+)")
+_PAREN_RE = re.compile(r'\([^)]*\)')  # Text in brackets (e.g. "(2)", "(Remastered)")
+# Track positions: disc-track (e.g. "1-1"), lettered (e.g. "A1", starts with a letter) or numeric (e.g. "1")
+_TRACK_POSITION_RE = re.compile(r'(?:(\d+)\s*-\s*(\d+)$|([^\W\d_])|(\d+)$)')
+
+# Translation table to delete every (ASCII) character which isn't a digit
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
 class DiscogsClientError(Exception):
     """Custom exception for Discogs client errors."""
     pass
@@ -33,7 +48,31 @@ class PDFGenerationError(Exception):
     """Custom exception for PDF generation errors."""
     pass
 
-def initialize_discogs_client() -> discogs_client.Client:
+class _SessionFetcher:
+    """
+    Fetcher for discogs_client which sends every request through one shared requests.Session.
+
+    The fetchers built into discogs_client call requests.request(), which opens a new connection
+    (and TLS handshake) for each request. A session keeps the connections to api.discogs.com alive.
+    Every request is throttled to the Discogs rate limit (lower when there is no user token).
+    """
+    def __init__(self, user_token: Optional[str] = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.user_token = user_token
+        self.rate_limit = DISCOGS_RATE_LIMIT if user_token else DISCOGS_RATE_LIMIT_UNAUTHENTICATED
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=FETCH_MAX_WORKERS, pool_maxsize=FETCH_MAX_WORKERS, max_retries=3)
+        self.session.mount('https://', adapter)
+
+    def fetch(self, client, method, url, data=None, headers=None, json=True):
+        params = {'token': self.user_token} if self.user_token else None
+        _throttle(self.rate_limit)
+        resp = self.session.request(method, url, params=params, data=data, headers=headers)
+        return resp.content, resp.status_code
+
+def initialize_discogs_client() -> "discogs_client.Client":
     """
     Initialize and return a Discogs client with authentication.
     
@@ -43,20 +82,40 @@ def initialize_discogs_client() -> discogs_client.Client:
     Raises:
         DiscogsClientError: If the user token is not found or invalid
     """
+    import discogs_client
+    from dotenv import load_dotenv
+
     load_dotenv()
     user_token = os.getenv("DISCOGS_USER_TOKEN")
 
     # There should be a token but for initial usage, skipping
     #if not user_token:
         #raise DiscogsClientError("Discogs user token not found in environment variables")
-    return discogs_client.Client('simple_cd_stripper/1.0', user_token=user_token)
+    client = discogs_client.Client('simple_cd_stripper/1.0', user_token=user_token)
+    # Reuse HTTP connections across fetches (discogs_client has no public option for this)
+    # noinspection PyProtectedMember
+    client._fetcher = _SessionFetcher(user_token)
+    return client
+
+# The client is initialized on first use
+_discogs: Optional["discogs_client.Client"] = None
+_discogs_lock = threading.Lock()
 
-# Initialize the client at the module level
-try:
-    discogs = initialize_discogs_client()
-except DiscogsClientError as e:
-    print(f"Warning: {e}")
-    discogs = None
+def _get_client() -> Optional["discogs_client.Client"]:
+    """
+    Return the shared Discogs client, initializing it on first use.
+
+    Returns:
+        discogs_client.Client: Authenticated Discogs client, or None if it could not be initialized
+    """
+    global _discogs
+    with _discogs_lock:
+        if _discogs is None:
+            try:
+                _discogs = initialize_discogs_client()
+            except DiscogsClientError as e:
+                print(f"Warning: {e}")
+    return _discogs
 
 def extract_discogs_id(url: str) -> Tuple[str, int]:
     """
@@ -71,57 +130,129 @@ def extract_discogs_id(url: str) -> Tuple[str, int]:
     Raises:
         ValueError: If the URL format is invalid
     """
-    match = re.search(r"discogs\.com/(release|master)/(\d+)", url)
+    # Find where the regex has to start, rather than have the regex engine search every position
+    match = None
+    idx = url.find("discogs.com/")
+    while idx >= 0 and not match:
+        match = _DISCOGS_URL_RE.match(url, idx)
+        idx = url.find("discogs.com/", idx + 1)
     if not match:
         raise ValueError("Invalid Discogs URL format")
     return match.group(1), int(match.group(2))
 
-def _parse_track_position(position: str, track_map: Dict[str, int]) -> Tuple[int, int, int]:
+# Discogs allows 60 requests per minute (authenticated) or 25 (unauthenticated), throttle requests across all threads
+DISCOGS_RATE_LIMIT = 60  # requests
+DISCOGS_RATE_LIMIT_UNAUTHENTICATED = 25  # requests
+DISCOGS_RATE_PERIOD = 60  # seconds
+FETCH_MAX_WORKERS = 8
+_throttle_lock = threading.Lock()
+_request_times: Deque[float] = deque()
+
+def _throttle(rate_limit: int = DISCOGS_RATE_LIMIT) -> None:
+    """Block until another Discogs request can be made without exceeding rate_limit requests per period."""
+    with _throttle_lock:
+        now = time.monotonic()
+        while _request_times and now - _request_times[0] >= DISCOGS_RATE_PERIOD:
+            _request_times.popleft()
+        if len(_request_times) >= rate_limit:
+            time.sleep(DISCOGS_RATE_PERIOD - (now - _request_times.popleft()))
+            now = time.monotonic()
+        _request_times.append(now)
+
+# Cache for Discogs responses (saves repeat network round-trips for the same release/master)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scs")
+CACHE_TTL = 7 * 24 * 60 * 60  # seconds (7 days)
+CACHE_VERSION = 6  # Bump when DiscData/DiscTrack or the parsing of them change so old cached entries are not loaded
+CACHE_FILE = os.path.join(CACHE_DIR, f"discogs_v{CACHE_VERSION}")
+_cache_lock = threading.Lock()
+
+def _cache_get(key: str) -> Optional[List[DiscData]]:
+    """
+    Look up previously fetched release data in the on-disk cache.
+
+    Args:
+        key: Cache key in the form "<id_type>:<discogs_id>"
+
+    Returns:
+        The cached list of DiscData objects, or None if missing/expired/unreadable
+    """
+    try:
+        # Read only, so a lookup never creates the cache files (a missing cache raises and is a miss)
+        with _cache_lock, shelve.open(CACHE_FILE, flag='r') as cache:
+            entry = cache.get(key)
+    except Exception:
+        # The cache is only an optimisation, never fail a fetch because of it
+        return None
+
+    if entry is None:
+        return None
+    stored_at, data = entry
+    if time.time() - stored_at > CACHE_TTL:
+        return None
+    return data
+
+def _cache_set(key: str, data: List[DiscData]) -> None:
+    """
+    Store fetched release data in the on-disk cache.
+
+    Args:
+        key: Cache key in the form "<id_type>:<discogs_id>"
+        data: List of DiscData objects to store
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with _cache_lock, shelve.open(CACHE_FILE) as cache:
+            cache[key] = (time.time(), data)
+    except Exception as e:
+        print(f"Warning: Unable to write to cache {CACHE_DIR}: {e}")
+
+def _parse_track_position(position: str, lettered_count: List[int]) -> Tuple[int, int, int]:
     """
     Parse track position string to extract disc and track numbers.
     
     Args:
         position: Track position string (e.g., "1-1", "A1", "1")
-        track_map: Dictionary to maintain running count for lettered tracks
+        lettered_count: Single item list holding the running count for lettered tracks (updated in place)
     
     Returns:
         Tuple of (disc_number, track_number, overall_number)
     """
+    match = _TRACK_POSITION_RE.match(position.strip())
+    matched_format = match.lastindex if match else None
+
     # Handle disc-track format (e.g., "1-1")
-    if '-' in position:
-        disc_str, track_str = position.split('-', 1)
-        try:
-            disc_num = int(disc_str)
-            track_num = int(track_str)
-            overall_num = (disc_num - 1) * 100 + track_num  # Use 100 tracks per disc as a buffer
-            return disc_num, track_num, overall_num
-        except ValueError:
-            pass
+    if matched_format == 2:
+        disc_num = int(match.group(1))
+        track_num = int(match.group(2))
+        overall_num = (disc_num - 1) * 100 + track_num  # Use 100 tracks per disc as a buffer
+        return disc_num, track_num, overall_num
 
     # Handle lettered format (e.g., "A1", "B2")
-    if position and position[0].isalpha():
-        letter = position[0].upper()
-        try:
-            if letter not in track_map:
-                # Initialize a new letter sequence
-                track_map[letter] = max(track_map.values(), default=0) + 1
-            else:
-                # Increment the track count
-                track_map[letter] = track_map[letter] + 1
-            disc_num=1# This might be wrong, but in cases where there are A/B values, it's for LPs, rather than CDs, assuming a single disk (this is a dirty hack)
-            track_num=max(track_map.values(), default=0)# get the rolling value
-            overall_num = track_num # This might be wrong if there are A/B/C listings for multiple disks
-            return disc_num, track_num, overall_num
-        except ValueError:
-            pass
+    if matched_format == 3:
+        lettered_count[0] += 1
+        disc_num=1# This might be wrong, but in cases where there are A/B values, it's for LPs, rather than CDs, assuming a single disk (this is a dirty hack)
+        track_num=lettered_count[0]# get the rolling value
+        overall_num = track_num # This might be wrong if there are A/B/C listings for multiple disks
+        return disc_num, track_num, overall_num
 
     # Handle simple numeric format (e.g., "1")
-    try:
-        # noinspection PyTypeChecker
-        num = int(''.join(filter(str.isdigit, position)))
+    if matched_format == 4:
+        num = int(match.group(4))
         return 1, num, num
-    except ValueError:
-        return 1, 0, 0  # Default fallback
+
+    # Anything else (e.g., "1.2"), use whatever digits are present
+    digits = position.translate(_NON_DIGIT_TABLE)
+    if not digits.isdecimal():
+        # Non-ASCII characters (e.g. an en dash) aren't removed by the table
+        digits = ''.join(c for c in digits if c.isdigit())
+    if digits.isdecimal():
+        num = int(digits)
+        return 1, num, num
+    return 1, 0, 0  # Default fallback
+
+def _is_sorted(values: List[int]) -> bool:
+    """Check if values are already in ascending order."""
+    return all(a <= b for a, b in zip(values, values[1:]))
 
 def fetch_release_data(id_type: str, discogs_id: int) -> List[DiscData]:
     """
@@ -138,11 +269,17 @@ def fetch_release_data(id_type: str, discogs_id: int) -> List[DiscData]:
         DiscogsClientError: If there's an error fetching data from Discogs
         ValueError: If the ID type is invalid
     """
+    cache_key = f"{id_type}:{discogs_id}"
+    cached_data = _cache_get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
+    discogs = _get_client()
     if not discogs:
         raise DiscogsClientError("Discogs client not initialized")
 
     discs: Dict[int, DiscData] = {}
-    track_map: Dict[str, int] = {}  # For tracking lettered positions
+    lettered_count: List[int] = [0]  # For tracking lettered positions
     
     try:
         # Validate and fetch release
@@ -153,9 +290,16 @@ def fetch_release_data(id_type: str, discogs_id: int) -> List[DiscData]:
         else:
             raise ValueError(f"Unknown Discogs ID type: {id_type}")
 
+        # Read the raw JSON once, the client's attribute access builds new proxy objects (and may lazy load) every time
+        album = release.fetch('title')
+        # Discogs adds a number to the name of the artist (if there is more than one artist with the same name), remove it if present:
+        artist = _PAREN_RE.sub('', release.fetch('artists')[0]['name']).strip()
+        tracklist = release.fetch('tracklist', [])
+
         # First pass: Parse all tracks to determine disc structure
-        for track in release.tracklist:
-            disc_num, track_num, overall_num = _parse_track_position(track.position, track_map)
+        for track in tracklist:
+            position, title = track['position'], track['title']
+            disc_num, track_num, overall_num = _parse_track_position(position, lettered_count)
 
             # Skip 'Bonus Tracks' lable/info rows from listing
             if track_num == 0 and overall_num == 0:
@@ -163,33 +307,75 @@ def fetch_release_data(id_type: str, discogs_id: int) -> List[DiscData]:
             
             if disc_num not in discs:
                 discs[disc_num] = DiscData(
-                    album=release.title,
-                    artist=release.artists[0].name,
+                    album=album,
+                    artist=artist,
                     disc=disc_num,
                     tracks=[]
                 )
             
             track_obj = DiscTrack(
-                position=track.position,
-                title=track.title,
+                position=position,
+                title=title,
+                display_title=_PAREN_RE.sub('', title).strip() if STRIP_BRACKETS else title,
                 disc_number=disc_num,
                 track_number=track_num,
                 overall_number=overall_num
             )
             discs[disc_num].tracks.append(track_obj)
 
-        # Sort tracks within each disc by overall_number
+        # Sort tracks within each disc by overall_number (Discogs usually lists them in order already)
         for disc in discs.values():
-            disc.tracks.sort(key=lambda x: x.overall_number)
+            if not _is_sorted([track.overall_number for track in disc.tracks]):
+                disc.tracks.sort(key=lambda x: x.overall_number)
 
         # Sort discs by disc number
-        return sorted(discs.values(), key=lambda x: x.disc)
+        disc_data = list(discs.values())
+        if not _is_sorted([disc.disc for disc in disc_data]):
+            disc_data.sort(key=lambda x: x.disc)
+        _cache_set(cache_key, disc_data)
+        return disc_data
 
     except (AttributeError, KeyError) as e:
         raise DiscogsClientError(f"Invalid or incomplete data received from Discogs: {str(e)}")
     except Exception as e:
         raise DiscogsClientError(f"Unexpected error while fetching release data: {str(e)}")
 
+def fetch_urls_data(
+    urls: List[str],
+    fetch: Callable[[str, int], List[DiscData]] = fetch_release_data,
+) -> Tuple[List[DiscData], List[Tuple[str, Exception]]]:
+    """
+    Fetch release data for multiple Discogs URLs concurrently.
+
+    Args:
+        urls: List of Discogs release or master URLs
+        fetch: Function used to fetch the data for a single (id_type, discogs_id)
+
+    Returns:
+        Tuple of (all DiscData objects in URL order, list of (url, error) for failed URLs)
+    """
+    def fetch_url(url: str) -> List[DiscData]:
+        id_type, discogs_id = extract_discogs_id(url)
+        return fetch(id_type, discogs_id)
+
+    results: Dict[int, List[DiscData]] = {}
+    errors: Dict[int, Tuple[str, Exception]] = {}
+
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_url, url): idx for idx, url in enumerate(urls)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                errors[idx] = (urls[idx], e)
+
+    # Keep the output in the same order as the URLs were given
+    all_disc_data: List[DiscData] = []
+    for idx in sorted(results):
+        all_disc_data.extend(results[idx])
+    return all_disc_data, [errors[idx] for idx in sorted(errors)]
+
 # Constants for PDF generation
 TRACK_STRIP_WIDTH = 74  # mm
 TRACK_STRIP_HEIGHT = 109  # mm
@@ -201,6 +387,13 @@ DEFAULT_FONT_SIZE = 10
 MIN_FONT_SIZE = 6
 ALTERNATE_COLOR = (255, 255, 200)  # Light yellow in RGB
 STRIP_BRACKETS = True # For now some titles have brackets in them which contain extra information and make them too long, strip them out
+# (x, y) offset of each strip on a page: top left, top right, bottom left, bottom right
+_STRIP_OFFSETS = (
+    (0, 0),
+    (TRACK_STRIP_WIDTH, 0),
+    (0, TRACK_STRIP_HEIGHT),
+    (TRACK_STRIP_WIDTH, TRACK_STRIP_HEIGHT),
+)
 
 def generate_pdf(
     data: List[DiscData], 
@@ -208,7 +401,7 @@ def generate_pdf(
     alternate_backgrounds: bool = False,
     show_title_bg: bool = False,
     show_ruler: bool = False,
-) -> Optional[BytesIO]:
+) -> Optional[bytearray]:
     """
     Generate a PDF with the album information.
     
@@ -220,12 +413,14 @@ def generate_pdf(
         show_ruler: Whether to draw a ruler to help visualize the sizing in the PDF print
     
     Returns:
-        BytesIO object containing the PDF if output_path is None, None otherwise
+        PDF contents as bytes if output_path is None, None otherwise
     
     Raises:
         PDFGenerationError: If there's an error generating the PDF
     """
     try:
+        from fpdf import FPDF
+
         pdf = FPDF("P", "mm", "A4")
         pdf.set_auto_page_break(auto=False)
         pdf.set_margins(10, 10, 10)
@@ -238,40 +433,55 @@ def generate_pdf(
         #pdf.set_draw_color(r=255, g=0, b=255)
         #pdf.set_text_color(r=255, g=0, b=255)
 
+        def draw_lines(lines: List[Tuple[float, float, float, float]]) -> None:
+            """Draw (x1, y1, x2, y2) lines as a single path, rather than a separate path per line."""
+            if not lines:
+                return
+            k, h = pdf.k, pdf.h
+            path = " ".join(f"{x1 * k:.2f} {(h - y1) * k:.2f} m {x2 * k:.2f} {(h - y2) * k:.2f} l"
+                            for x1, y1, x2, y2 in lines)
+            # noinspection PyProtectedMember
+            pdf._out(f"{path} S")
+
         def draw_ruler(x: float, y: float, width: float) -> None:
             """Draw a ruled line. Include markings for each mm"""
-            pdf.line(x, y, x+width, y)
-            mm_count = width
-            mm_point = 0
-            while mm_point <= mm_count:
-                draw_height = 1
-                if mm_point % 10 == 0:
-                    draw_height = 3
-                pdf.line(x+mm_point, y, x+mm_point, y+draw_height)
-                mm_point+=1
+            mm_count = int(width) + 1
+            short_ticks = [mm_point for mm_point in range(mm_count) if mm_point % 10]
+            long_ticks = range(0, mm_count, 10)
+
+            ruler_lines = [(x, y, x+width, y)]
+            ruler_lines += [(x+mm_point, y, x+mm_point, y+1) for mm_point in short_ticks]
+            ruler_lines += [(x+mm_point, y, x+mm_point, y+3) for mm_point in long_ticks]
+            draw_lines(ruler_lines)
 
         def add_crop_marks(x: float, y: float, right_wing=True, left_wing=True, bottom_wing=True, top_wing=True) -> None:
             # Crop marks should be outside so not seen in the content
+            crop_lines = []
             # Top left
             if top_wing:
-                pdf.dashed_line(x, y, x - 5, y)
+                crop_lines.append((x, y, x - 5, y))
             if left_wing:
-                pdf.dashed_line(x, y, x, y - 5)
+                crop_lines.append((x, y, x, y - 5))
             # Top right
             if right_wing:
-                pdf.dashed_line(x + TRACK_STRIP_WIDTH, y, x + TRACK_STRIP_WIDTH + 5, y)
+                crop_lines.append((x + TRACK_STRIP_WIDTH, y, x + TRACK_STRIP_WIDTH + 5, y))
             if top_wing:
-                pdf.dashed_line(x + TRACK_STRIP_WIDTH, y, x + TRACK_STRIP_WIDTH, y - 5)
+                crop_lines.append((x + TRACK_STRIP_WIDTH, y, x + TRACK_STRIP_WIDTH, y - 5))
             # Bottom left
             if bottom_wing:
-                pdf.dashed_line(x, y + TRACK_STRIP_HEIGHT, x - 5, y + TRACK_STRIP_HEIGHT)
+                crop_lines.append((x, y + TRACK_STRIP_HEIGHT, x - 5, y + TRACK_STRIP_HEIGHT))
             if left_wing:
-                pdf.dashed_line(x, y + TRACK_STRIP_HEIGHT, x, y + TRACK_STRIP_HEIGHT + 5)
+                crop_lines.append((x, y + TRACK_STRIP_HEIGHT, x, y + TRACK_STRIP_HEIGHT + 5))
             # Bottom right
             if bottom_wing:
-                pdf.dashed_line(x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT, x + TRACK_STRIP_WIDTH + 5, y + TRACK_STRIP_HEIGHT)
+                crop_lines.append((x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT, x + TRACK_STRIP_WIDTH + 5, y + TRACK_STRIP_HEIGHT))
             if right_wing:
-                pdf.dashed_line(x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT, x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT + 5)
+                crop_lines.append((x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT, x + TRACK_STRIP_WIDTH, y + TRACK_STRIP_HEIGHT + 5))
+
+            # The dash pattern restarts for each line in the path, so they look the same as separate dashed lines
+            pdf.set_dash_pattern(dash=1, gap=1)
+            draw_lines(crop_lines)
+            pdf.set_dash_pattern()
 
         def create_album_artist_background(x: float, y: float) -> None:
             """Create a background image for the album artist."""
@@ -290,18 +500,40 @@ def generate_pdf(
             pdf.set_fill_color(r, g, b)
             pdf.rect(tl_x, tl_y, br_x_length, br_y_length, style="F")
 
+        # Text is measured on a separate document so the font changes don't end up in the PDF output
+        measure_pdf = FPDF("P", "mm", "A4")
+
+        # Width of each character at font size 1 for each (font family, style)
+        # The core fonts have no kerning, so the width of a string is the sum of its character widths
+        char_widths: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+        # Cached per PDF, as the same strings are measured repeatedly while fitting and wrapping text
+        @lru_cache(maxsize=1024)
+        def unit_width(text: str, font_family: str, font_style: str) -> float:
+            """Return the width of text at font size 1, multiply by a font size to get the width at that size."""
+            widths = char_widths.setdefault((font_family, font_style), {})
+            new_chars = set(text).difference(widths)
+            if new_chars:
+                # noinspection PyTypeChecker
+                measure_pdf.set_font(family=font_family, size=1, style=font_style)
+                for char in new_chars:
+                    widths[char] = measure_pdf.get_string_width(char)
+            return sum(widths[char] for char in text)
+
         def find_fitting_font_size(text: str, max_width: float,
                                    font_family=DEFAULT_FONT,
                                    initial_size: int = DEFAULT_FONT_SIZE,
                                    font_style: Literal["", "B", "I", "U", "BU", "UB", "BI", "IB", "IU", "UI", "BIU", "BUI", "IBU", "IUB", "UBI", "UIB"] = ""
                                    ) -> float:
-            """Find the largest font size that fits the text within max_width."""
-            font_size = initial_size
-            pdf.set_font(family=font_family, size=font_size, style=font_style)
-            while pdf.get_string_width(text) > max_width and font_size > MIN_FONT_SIZE:
-                font_size -= 0.5
-                pdf.set_font(family=font_family, size=font_size, style=font_style)
-            return font_size
+            """Find the largest font size (in 0.5 steps down from initial_size) that fits the text within max_width."""
+            text_width = unit_width(text, font_family, font_style) * initial_size
+            if text_width <= max_width or initial_size <= MIN_FONT_SIZE:
+                return initial_size
+
+            # String width scales linearly with font size, so one measurement is enough to calculate the fitting size
+            fitting_size = max_width * initial_size / text_width
+            steps = math.ceil((initial_size - fitting_size) / 0.5)
+            return max(initial_size - (steps * 0.5), MIN_FONT_SIZE)
 
         # noinspection PyTypeChecker
         def write_text_box(text: str, x: float, y: float, max_width: float,
@@ -314,14 +546,19 @@ def generate_pdf(
             lines = []
             current_line = []
             
-            pdf.set_font(family=font_family, size=font_size, style=font_style)
+            # Keep a running width for the line, rather than re-measuring the whole line for each word
+            space_width = unit_width(' ', font_family, font_style) * font_size
+            line_width = 0.0
             for word in words:
-                test_line = ' '.join(current_line + [word])
-                if not current_line or pdf.get_string_width(test_line) <= max_width:
+                word_width = unit_width(word, font_family, font_style) * font_size
+                added_width = word_width + (space_width if current_line else 0)
+                if not current_line or line_width + added_width <= max_width:
                     current_line.append(word)
+                    line_width += added_width
                 else:
                     lines.append(' '.join(current_line))
                     current_line = [word]
+                    line_width = word_width
             if current_line:
                 lines.append(' '.join(current_line))
 
@@ -359,26 +596,14 @@ def generate_pdf(
         # idx will range from 0 to len(data)-1, two strips per page
         total_iterations=len(data)-1
         for idx, disc in enumerate(data):
-            if idx >= 4:
+            if idx >= len(_STRIP_OFFSETS):
                 # Not supporting more than 4 CDs on one page for now
                 print('Warning: More than 4 disks; Ignoring extra disks/data')
                 break
             # Calculate position based on index (0-3 for each page)
-            page_position = idx % 4  # Will be 0, 1, 2, or 3
-            if page_position == 0:
-                # Top left
-                x, y = starting_x, starting_y
-            elif page_position == 1:
-                # Top right
-                x, y = starting_x + TRACK_STRIP_WIDTH, starting_y
-            elif page_position == 2:
-                # Bottom left
-                x, y = starting_x, starting_y + TRACK_STRIP_HEIGHT
-            elif page_position == 3:
-                # Bottom right
-                x, y = starting_x + TRACK_STRIP_WIDTH, starting_y + TRACK_STRIP_HEIGHT
-            else:  # More than 4 strips to a page. Ignore them for now
-                continue
+            page_position = idx % len(_STRIP_OFFSETS)
+            offset_x, offset_y = _STRIP_OFFSETS[page_position]
+            x, y = starting_x + offset_x, starting_y + offset_y
 
             # Add crop marks
             add_crop_marks(x, y)
@@ -402,8 +627,6 @@ def generate_pdf(
 
             # Add Disk artist
             title_artist = f"{disc.artist}"
-            # Discogs ads a number to the name of the artist (if there is more than one artist with the same name), remove it if present:
-            title_artist = re.sub(r'\([^)]*\)', '', title_artist).strip()
             title_font_size = find_fitting_font_size(title_artist, content_width, font_style='B', initial_size=DEFAULT_FONT_SIZE_ARTIST)
             title_height = write_text_box(title_artist, content_x, current_y, content_width, font_style='B', font_size=title_font_size)
             current_y = content_y + title_height
@@ -419,19 +642,15 @@ def generate_pdf(
             tracks_count = len(disc.tracks)
             max_track_height = available_height / tracks_count
             
+            # Track cells are only filled with alternate backgrounds, otherwise the fill colour isn't needed
+            track_fill_colors = ((255, 255, 255), ALTERNATE_COLOR)
+
             for track_idx, track in enumerate(disc.tracks):
-                if alternate_backgrounds and track_idx % 2 == 1:
-                    pdf.set_fill_color(*ALTERNATE_COLOR)
-                else:
-                    pdf.set_fill_color(255, 255, 255)
+                if alternate_backgrounds:
+                    pdf.set_fill_color(*track_fill_colors[track_idx % 2])
                 
-                track_text = f"{track.track_number:02d} {track.title}"
-
-                # Remove any text in brackets
-                if STRIP_BRACKETS:
-                    track_text = re.sub(r'\([^)]*\)', '', track_text).strip()
+                track_text = f"{track.track_number:02d} {track.display_title}"
 
-                pdf.set_font(DEFAULT_FONT, size=DEFAULT_FONT_SIZE)
                 track_font_size = find_fitting_font_size(track_text, content_width)
                 # noinspection PyTypeChecker
                 pdf.set_font(DEFAULT_FONT, size=track_font_size)
@@ -445,11 +664,7 @@ def generate_pdf(
             pdf.output(output_path)
             return None
         else:
-            buf = io.BytesIO()
-            # noinspection PyTypeChecker
-            pdf.output(buf)
-            buf.seek(0)
-            return buf
+            return pdf.output()
 
     except Exception as e:
         raise PDFGenerationError(f"Failed to generate PDF: {str(e)}")
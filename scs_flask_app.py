@@ -1,8 +1,22 @@
+import time
+from functools import lru_cache
 from typing import List
-from scs_core import extract_discogs_id, fetch_release_data, generate_pdf
-from flask import Flask, request, jsonify, send_file, render_template
+from scs_core import DiscData, fetch_release_data, fetch_urls_data, generate_pdf
+from flask import Flask, Response, request, jsonify, render_template
 app = Flask(__name__)
 
+# In-process cache in front of the on-disk cache, repeated requests skip even the disk hit
+# Entries are kept for at most an hour, on top of the age of the on-disk entry they were read from
+IN_PROCESS_CACHE_TTL = 60 * 60  # seconds (1 hour)
+
+@lru_cache(maxsize=256)
+def _cached_fetch(id_type: str, discogs_id: int, ttl_bucket: int) -> List[DiscData]:
+    return fetch_release_data(id_type, discogs_id)
+
+def cached_fetch_release_data(id_type: str, discogs_id: int) -> List[DiscData]:
+    """Fetch release data, cached in process for at most IN_PROCESS_CACHE_TTL (the key changes every bucket)."""
+    return _cached_fetch(id_type, discogs_id, int(time.time() // IN_PROCESS_CACHE_TTL))
+
 @app.route("/", methods=["GET"])
 def index():
     return render_template('main_page.html'), 200
@@ -42,18 +56,9 @@ def generate_label():
         ########################################################################
         # Process
         ########################################################################
-        all_disc_data = []
-        errors = []
-
-        # ... fetch/prepare DiscData objects into discs list ...
-        for url in urls:
-            try:
-                id_type, discogs_id = extract_discogs_id(url)
-                disc_data = fetch_release_data(id_type, discogs_id)
-                all_disc_data.extend(disc_data)
-            except Exception as e:
-                errors.append({"url": url, "error": str(e)})
-                continue
+        # Fetch/prepare DiscData objects (URLs are fetched concurrently)
+        all_disc_data, fetch_errors = fetch_urls_data(urls, fetch=cached_fetch_release_data)
+        errors = [{"url": url, "error": str(e)} for url, e in fetch_errors]
 
         if not all_disc_data:
             return jsonify({
@@ -61,17 +66,16 @@ def generate_label():
                 "details": errors
             }), 400
 
-        pdf_buf = generate_pdf(all_disc_data,
-                               show_title_bg=show_title_bg,
-                               show_ruler=show_ruler
-                              )
+        pdf_bytes = generate_pdf(all_disc_data,
+                                 show_title_bg=show_title_bg,
+                                 show_ruler=show_ruler
+                                )
 
         # Send PDF
-        response = send_file(
-            pdf_buf,
+        response = Response(
+            pdf_bytes,
             mimetype='application/pdf',
-            as_attachment=True,
-            download_name="jukebox_labels.pdf"
+            headers={'Content-Disposition': 'attachment; filename=jukebox_labels.pdf'}
         )
 
         # Add warnings about any failed URLs if there were partial failures
@@ -1,21 +1,80 @@
 # scs_test_app.py
 import unittest
-from scs_core import extract_discogs_id, fetch_release_data
+from unittest import mock
+import scs_core
+from scs_core import extract_discogs_id, fetch_release_data, fetch_urls_data, _parse_track_position
+from scs_core import DiscData, DiscTrack, _cache_get, _cache_set
 import os
+import tempfile
 
 class TestDiscogsFunctions(unittest.TestCase):
 
     def test_extract_discogs_id_valid(self):
         self.assertEqual(extract_discogs_id("https://www.discogs.com/release/3992501-Example"), ("release", 3992501))
         self.assertEqual(extract_discogs_id("https://www.discogs.com/master/1326585-Example"), ("master", 1326585))
+        self.assertEqual(extract_discogs_id("https://www.discogs.com/sell/x?u=discogs.com/release/5"), ("release", 5))
 
     def test_extract_discogs_id_invalid(self):
         with self.assertRaises(ValueError):
             extract_discogs_id("https://www.google.com")
 
+    def test_parse_track_position(self):
+        self.assertEqual(_parse_track_position("2-3", [0]), (2, 3, 103))
+        self.assertEqual(_parse_track_position("1-1 ", [0]), (1, 1, 1))
+        self.assertEqual(_parse_track_position(" 2-3", [0]), (2, 3, 103))
+        self.assertEqual(_parse_track_position("2 - 3", [0]), (2, 3, 103))
+        self.assertEqual(_parse_track_position("7", [0]), (1, 7, 7))
+        self.assertEqual(_parse_track_position("1.2", [0]), (1, 12, 12))
+        self.assertEqual(_parse_track_position("1\u20134", [0]), (1, 14, 14))
+        self.assertEqual(_parse_track_position("", [0]), (1, 0, 0))
+        lettered_count = [0]
+        self.assertEqual([_parse_track_position(p, lettered_count) for p in ["A1", "A2", "B1", "A3"]],
+                         [(1, 1, 1), (1, 2, 2), (1, 3, 3), (1, 4, 4)])
+
     def test_fetch_release_data_invalid_type(self):
         with self.assertRaises(ValueError):
             fetch_release_data("invalid", 1234)
 
+    def test_fetch_urls_data_keeps_url_order(self):
+        def fake_fetch(id_type, discogs_id):
+            return [f"{id_type}:{discogs_id}"]
+        urls = [
+            "https://www.discogs.com/release/3",
+            "https://www.google.com",
+            "https://www.discogs.com/master/1",
+            "https://www.discogs.com/release/2",
+        ]
+        data, errors = fetch_urls_data(urls, fetch=fake_fetch)
+        self.assertEqual(data, ["release:3", "master:1", "release:2"])
+        self.assertEqual([url for url, _ in errors], ["https://www.google.com"])
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+        for name, value in [("CACHE_DIR", self.cache_dir), ("CACHE_FILE", os.path.join(self.cache_dir, "discogs"))]:
+            patcher = mock.patch.object(scs_core, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.data = [DiscData(album="Album", artist="Artist", disc=1, tracks=[
+            DiscTrack(position="1", title="Title", display_title="Title", disc_number=1, track_number=1, overall_number=1)
+        ])]
+
+    def test_cache_miss_does_not_create_files(self):
+        self.assertIsNone(_cache_get("release:1"))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_cache_hit(self):
+        _cache_set("release:1", self.data)
+        self.assertEqual(_cache_get("release:1"), self.data)
+        self.assertIsNone(_cache_get("master:1"))
+
+    def test_cache_expired(self):
+        _cache_set("release:1", self.data)
+        with mock.patch.object(scs_core, "CACHE_TTL", -1):
+            self.assertIsNone(_cache_get("release:1"))
+
 if __name__ == '__main__':
     unittest.main()